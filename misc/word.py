@@ -13,29 +13,101 @@ Requirements:
     - pandoc: Document conversion (external dependency - brew install pandoc)
 """
 
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Deque, Dict, List, Tuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from enum import Enum
 from pathlib import Path
 from docx import Document
-from docx.shared import Pt, Cm, RGBColor, Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Pt, Cm, Emu, RGBColor, Inches, Twips
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
 from docx.oxml.shared import OxmlElement
-from docx.oxml.ns import qn
+from docx.oxml.ns import qn, nsdecls, nsmap
 from docx.oxml import parse_xml
-from docx.table import _Cell
+from docx.oxml.table import CT_Tc
+from docx.table import Table
+from docx.oxml.shape import CT_Inline
+from lxml import etree
 import subprocess
 import shutil
 import re
 import logging
 import platform
+import os
+import copy
+import atexit
+import functools
+import tempfile
+from xml.sax.saxutils import escape
+import base64
+import http.client
+import json
+import socket
+import time
+import io
+
+
+# Library logger; output is configured by the application (see __main__ below)
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Namespace-qualified tag and attribute names, resolved once at import
+_QN_LANG = qn('w:lang')
+_QN_SPACING = qn('w:spacing')
+_QN_P = qn('w:p')
+_QN_R = qn('w:r')
+_QN_PPR = qn('w:pPr')
+_QN_RPR = qn('w:rPr')
+_QN_DOC_DEFAULTS = qn('w:docDefaults')
+_QN_RPR_DEFAULT = qn('w:rPrDefault')
+_QN_TCBORDERS = qn('w:tcBorders')
+
+# Page number field run used in footers
+_PAGE_FIELD_XML = (
+    '<w:r><w:fldChar w:fldCharType="begin"/>'
+    '<w:instrText xml:space="preserve">PAGE</w:instrText>'
+    '<w:fldChar w:fldCharType="end"/></w:r>'
+)
+
+# Single-line borders on all four edges of a table cell, copied for each cell
+_TC_BORDERS = parse_xml(
+    f'<w:tcBorders {nsdecls("w")}>'
+    + ''.join(f'<w:{edge} w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+              for edge in ('top', 'left', 'bottom', 'right'))
+    + '</w:tcBorders>'
+)
+
+# Precompiled XPath expressions
+_W_NAMESPACES = {'w': nsmap['w']}
 
+# Default run properties of the styles part, where the document language lives
+_XPATH_DEFAULT_RPR = etree.XPath('./w:docDefaults/w:rPrDefault/w:rPr',
+                                 namespaces=_W_NAMESPACES)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(levelname)s: %(message)s'
+# Default run properties chain for a styles part that has none, copied when needed
+_DOC_DEFAULTS = parse_xml(
+    f'<w:docDefaults {nsdecls("w")}><w:rPrDefault><w:rPr/></w:rPrDefault></w:docDefaults>'
 )
-logger = logging.getLogger(__name__)
+
+# Numbering attached to a style's paragraph properties
+_XPATH_STYLE_NUMPR = etree.XPath('./w:pPr/w:numPr', namespaces=_W_NAMESPACES)
+
+# Single-spaced paragraph spacing applied to footnotes, copied for each paragraph
+_FOOTNOTE_SPACING = parse_xml(
+    f'<w:spacing {nsdecls("w")} w:before="0" w:after="0" w:line="240" w:lineRule="auto"/>'
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _pandoc_path() -> Optional[str]:
+    """Locate the pandoc executable once per process and return its absolute path."""
+    return shutil.which('pandoc')
+
+
+@functools.lru_cache(maxsize=64)
+def _pt(points: float) -> Pt:
+    """Convert a point size to a length, memoized since only a few sizes are used."""
+    return Pt(points)
 
 
 class PaperSize(Enum):
@@ -71,8 +143,16 @@ class DocumentConfig:
         generate_toc: Whether to generate table of contents
         language: Document language code (e.g., 'en-US', 'fr-CA')
         center_title: Whether to center the main title
+        per_run_language: Whether to also write the language on every run
+            instead of relying on the document default
     """
 
+    __slots__ = (
+        'style', 'paper_size', 'author', 'date', 'heading_colors', 'footer_text',
+        'font_name', 'base_font_size', 'margins', 'line_spacing', 'generate_toc',
+        'language', 'center_title', 'per_run_language'
+    )
+
     # Style constants
     DEFAULT_TITLE_SIZE = 24
     DEFAULT_HEADING_1_SIZE = 18
@@ -98,7 +178,8 @@ class DocumentConfig:
         line_spacing: float = 1.0,
         generate_toc: bool = True,
         language: str = "en-US",
-        center_title: bool = True
+        center_title: bool = True,
+        per_run_language: bool = False
     ):
         self.style = style
         self.paper_size = paper_size
@@ -120,6 +201,7 @@ class DocumentConfig:
         self.generate_toc = generate_toc
         self.language = language
         self.center_title = center_title
+        self.per_run_language = per_run_language
 
         # Validate configuration
         self._validate()
@@ -201,32 +283,186 @@ class MarkdownToDocxConverter:
     - Centered title option
     """
 
+    __slots__ = (
+        'config', 'verbose', '_lang_element',
+        '_pt_base', '_pt_para_spacing', '_pt_footnote', '_pt_title',
+        '_pt_table_font', '_pt_table_spacing',
+        '_footer_odd_xml', '_footer_even_xml',
+        '_page_dimensions', '_margins', '_standard_styles', '_heading_styles',
+        '_pandoc_proc', '_server_port'
+    )
+
     # Image processing constants
     MAX_IMAGE_WIDTH = Inches(6)
     SUPPORTED_IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.bmp'}
 
-    # Compiled regex patterns
+    # Line height of single-spaced paragraphs
+    SINGLE_LINE_SPACING = Twips(240)
+
+    # Page dimensions (width, height) by paper size
+    PAPER_DIMENSIONS = {
+        PaperSize.LETTER: (Inches(8.5), Inches(11)),
+        PaperSize.LEGAL: (Inches(8.5), Inches(14)),
+        PaperSize.A4: (Inches(8.27), Inches(11.69)),
+    }
+
+    # Style settings that do not depend on the configuration; font names,
+    # the Normal size and spacing, and heading colors are filled in per converter
+    STANDARD_STYLES = {
+        'Normal': {
+            'bold': False,
+            'space_before': 0,
+            'space_after': 0
+        },
+        'Title': {
+            'font_size': DocumentConfig.DEFAULT_TITLE_SIZE,
+            'bold': True,
+            'space_before': 12,
+            'space_after': 12,
+            'line_spacing': 1.0
+        }
+    }
+    HEADING_STYLES = {
+        1: {
+            'font_size': DocumentConfig.DEFAULT_HEADING_1_SIZE,
+            'bold': True,
+            'space_before': 18,
+            'space_after': 12,
+            'line_spacing': 1.0,
+            'italic': False
+        },
+        2: {
+            'font_size': DocumentConfig.DEFAULT_HEADING_2_SIZE,
+            'bold': True,
+            'space_before': 16,
+            'space_after': 10,
+            'line_spacing': 1.0,
+            'italic': False
+        },
+        3: {
+            'font_size': DocumentConfig.DEFAULT_HEADING_3_SIZE,
+            'bold': True,
+            'space_before': 14,
+            'space_after': 8,
+            'line_spacing': 1.0,
+            'italic': True
+        }
+    }
+
+    # Paragraph styles left untouched by normal paragraph formatting
+    UNFORMATTED_PARAGRAPH_STYLES = frozenset({'Title', 'Heading 1', 'Heading 2', 'Heading 3'})
+
+    # Pandoc server constants (seconds)
+    SERVER_STARTUP_TIMEOUT = 10
+    SERVER_REQUEST_TIMEOUT = 120
+
+    # Documents sent to the pandoc server per request
+    SERVER_BATCH_SIZE = 10
+
+    # Lua filter mapping Markdown H2 to Word Heading 1, H3 to Heading 2, etc.
+    LUA_FILTER = """
+        function Header(el)
+            if el.level > 1 then
+                el.level = el.level - 1
+            end
+            return el
+        end
+        """
+
+    # Lua filter file shared by all conversions in this process
+    _lua_script_path: Optional[Path] = None
+
+    # Compiled regex patterns. IMAGE_PATTERN starts with the literal '![', which
+    # the regex engine already uses to skip ahead, so no separate substring
+    # pre-check is done before scanning.
     IMAGE_PATTERN = re.compile(r'!\[(.*?)\]\((.*?)\)')
+    H1_PATTERN = re.compile(r'^# (.*)$', re.MULTILINE)
 
-    def __init__(self, config: DocumentConfig = None, verbose: bool = True):
+    def __init__(self, config: DocumentConfig = None, verbose: bool = True,
+                 use_server: bool = False):
         """
         Initialize the converter.
 
         Args:
             config: Document configuration. If None, uses default settings.
-            verbose: Enable verbose logging output.
+            verbose: Enable verbose logging output. Messages go to this
+                module's logger, so the caller must configure logging (for
+                example with logging.basicConfig) to see them.
+            use_server: Keep a `pandoc server` process (pandoc 3.0+) running for
+                the lifetime of the converter instead of starting pandoc for
+                every conversion. Call close() or use the converter as a
+                context manager to stop it.
         """
         self.config = config or DocumentConfig()
         self.verbose = verbose
+        self._lang_element = self._build_lang_element(self.config.language)
+
+        # Font sizes and spacing reused for every run and paragraph
+        self._pt_base = Pt(self.config.base_font_size)
+        self._pt_para_spacing = Pt(DocumentConfig.DEFAULT_PARAGRAPH_SPACING)
+        self._pt_footnote = Pt(DocumentConfig.DEFAULT_FOOTNOTE_FONT_SIZE)
+        self._pt_title = Pt(DocumentConfig.DEFAULT_TITLE_SIZE)
+        self._pt_table_font = Pt(DocumentConfig.DEFAULT_TABLE_FONT_SIZE)
+        self._pt_table_spacing = Pt(DocumentConfig.DEFAULT_TABLE_CELL_SPACING)
+
+        # Footer paragraphs, parsed into every section
+        self._footer_odd_xml = self._build_footer_xml(
+            'right', f"{self.config.footer_text['odd']} | ", page_first=False
+        )
+        self._footer_even_xml = self._build_footer_xml(
+            'left', f" | {self.config.footer_text['even']}", page_first=True
+        )
+        # Page size and margins applied to every section
+        self._page_dimensions = self.PAPER_DIMENSIONS.get(
+            self.config.paper_size, self.PAPER_DIMENSIONS[PaperSize.A4]
+        )
+        self._margins = tuple(Cm(margin) for margin in self.config.margins)
+
+        # Style configurations applied to every document
+        self._standard_styles, self._heading_styles = self._build_style_configurations()
+
+        self._pandoc_proc = None
+        self._server_port = None
 
         if not verbose:
             logger.setLevel(logging.WARNING)
 
         self._check_dependencies()
 
+        if use_server:
+            self._start_pandoc_server()
+
+    def __enter__(self) -> 'MarkdownToDocxConverter':
+        """Return the converter for use in a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Stop the pandoc server when leaving the with statement."""
+        self.close()
+
+    def __del__(self):
+        """Stop the pandoc server if the converter is garbage collected while it runs."""
+        if getattr(self, '_pandoc_proc', None) is not None:
+            self.close()
+
+    def close(self) -> None:
+        """Stop the pandoc server if one is running."""
+        proc = self._pandoc_proc
+        if proc is None:
+            return
+
+        self._pandoc_proc = None
+        self._server_port = None
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
     def _check_dependencies(self) -> None:
         """Verify that Pandoc is installed on the system."""
-        if not shutil.which('pandoc'):
+        if not _pandoc_path():
             system = platform.system()
             install_instructions = {
                 'Darwin': 'brew install pandoc',
@@ -240,6 +476,86 @@ class MarkdownToDocxConverter:
                 f"Installation: {instruction}"
             )
 
+    @staticmethod
+    def _build_lang_element(language: str):
+        """
+        Build the `w:lang` element for a language code.
+
+        Args:
+            language: Language code (e.g., 'en-US')
+
+        Returns:
+            Template element, copied for each run that needs a language
+        """
+        lang = escape(language, {'"': '&quot;'})
+        return parse_xml(f'<w:lang {nsdecls("w")} w:val="{lang}" '
+                         f'w:eastAsia="{lang}" w:bidi="{lang}"/>')
+
+    def _build_footer_xml(self, alignment: str, text: str, page_first: bool) -> str:
+        """
+        Build the serialized footer paragraph with its text and page number field.
+
+        Args:
+            alignment: Paragraph justification ('left' or 'right')
+            text: Footer text placed next to the page number
+            page_first: Whether the page number precedes the text
+
+        Returns:
+            XML string for a complete footer paragraph
+        """
+        font = escape(self.config.font_name, {'"': '&quot;'})
+        half_points = DocumentConfig.DEFAULT_FOOTER_FONT_SIZE * 2
+        text_run = (
+            f'<w:r><w:rPr><w:rFonts w:ascii="{font}" w:hAnsi="{font}"/>'
+            f'<w:sz w:val="{half_points}"/></w:rPr>'
+            f'<w:t xml:space="preserve">{escape(text)}</w:t></w:r>'
+        )
+        runs = _PAGE_FIELD_XML + text_run if page_first else text_run + _PAGE_FIELD_XML
+        return (
+            f'<w:p {nsdecls("w")}><w:pPr><w:pStyle w:val="Footer"/>'
+            f'<w:spacing w:before="240"/><w:jc w:val="{alignment}"/></w:pPr>'
+            f'{runs}</w:p>'
+        )
+
+    def _start_pandoc_server(self) -> None:
+        """
+        Launch `pandoc server` on a free local port and wait until it accepts connections.
+
+        Raises:
+            RuntimeError: If the server exits or does not come up in time
+        """
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+
+        proc = subprocess.Popen(
+            [_pandoc_path(), 'server', '--port', str(port),
+             '--timeout', str(self.SERVER_REQUEST_TIMEOUT)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+        deadline = time.monotonic() + self.SERVER_STARTUP_TIMEOUT
+        while True:
+            if proc.poll() is not None:
+                raise RuntimeError(
+                    f"Pandoc server exited with code {proc.returncode}. "
+                    f"'pandoc server' requires pandoc 3.0 or later."
+                )
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=0.1).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    proc.kill()
+                    proc.wait()
+                    raise RuntimeError("Pandoc server did not start in time")
+                time.sleep(0.05)
+
+        self._pandoc_proc = proc
+        self._server_port = port
+        logger.info(f"Pandoc server started on port {port}")
+
     def _extract_title_from_markdown(self, content: str) -> str:
         """
         Extract the main title (H1) from markdown content.
@@ -250,26 +566,27 @@ class MarkdownToDocxConverter:
         Returns:
             The first H1 heading found, or "Untitled Document" if none exists
         """
-        lines = content.split('\n')
-        for line in lines:
-            if line.startswith('# '):
-                return line[2:].strip()
-        return "Untitled Document"
+        match = self.H1_PATTERN.search(content)
+        return match.group(1).strip() if match else "Untitled Document"
 
-    def _extract_image_references(self, content: str) -> List[dict]:
+    def _scan_markdown(self, content: str) -> Tuple[str, Deque[dict], str]:
         """
-        Extract image references from markdown content.
+        Extract the title and image references and replace images with placeholders.
+
+        Image references are collected by the replacement callback of a single
+        regex substitution, so large documents are only walked once.
 
         Args:
             content: Markdown document content
 
         Returns:
-            List of dictionaries containing image metadata
+            Tuple of (title, image_refs, content with images replaced by placeholders),
+            where image_refs is a queue consumed in document order
         """
-        matches = self.IMAGE_PATTERN.findall(content)
+        image_refs = deque()
 
-        image_refs = []
-        for alt_text, path in matches:
+        def _collect_image(match):
+            alt_text, path = match.groups()
             path = path.strip()
             # Remove 'img/' prefix if present
             if path.startswith('img/'):
@@ -280,89 +597,245 @@ class MarkdownToDocxConverter:
                 'path': path,
                 'original_markdown': f'![{alt_text}]({path})'
             })
+            return '[IMAGE_PLACEHOLDER]'
 
-        logger.info(f"Found {len(image_refs)} image references")
-        return image_refs
-
-    def _remove_image_references(self, content: str) -> str:
-        """
-        Replace image references with placeholders.
-
-        Args:
-            content: Markdown document content
+        temp_content = self.IMAGE_PATTERN.sub(_collect_image, content)
 
-        Returns:
-            Content with images replaced by placeholders
-        """
-        return self.IMAGE_PATTERN.sub(r'[IMAGE_PLACEHOLDER]', content)
+        logger.info(f"Found {len(image_refs)} image references")
+        return self._extract_title_from_markdown(content), image_refs, temp_content
 
-    def _run_pandoc_conversion(self, input_path: Path, output_path: Path, title: str) -> None:
+    def _run_pandoc_conversion(self, content: str, title: str,
+                               lua_path: Path) -> bytes:
         """
         Run pandoc conversion with custom heading level mapping.
 
         This method uses a Lua filter to adjust heading levels so that
         Markdown H2 becomes Word Heading 1, H3 becomes Heading 2, etc.
+        The Markdown is piped through stdin and the DOCX is read from stdout,
+        so neither goes through an intermediate file.
 
         Args:
-            input_path: Path to input markdown file
-            output_path: Path to output docx file
+            content: Markdown content with images replaced by placeholders
             title: Document title
+            lua_path: Path to Lua filter script
+
+        Returns:
+            Raw bytes of the generated DOCX package
         """
-        lua_path = None
         try:
-            lua_path = self._create_lua_script(input_path)
-            cmd = self._build_pandoc_command(input_path, output_path, title, lua_path)
+            cmd = self._build_pandoc_command(title, lua_path)
 
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+            result = subprocess.run(cmd, input=content.encode('utf-8'),
+                                    check=True, capture_output=True)
             logger.info("Pandoc conversion completed successfully")
+            return result.stdout
 
         except subprocess.CalledProcessError as e:
-            logger.error(f"Pandoc conversion failed: {e.stderr}")
-            raise RuntimeError(f"Pandoc conversion failed: {e.stderr}")
+            stderr = e.stderr.decode('utf-8', errors='replace')
+            logger.error(f"Pandoc conversion failed: {stderr}")
+            raise RuntimeError(f"Pandoc conversion failed: {stderr}")
         except Exception as e:
             logger.error(f"Error during pandoc conversion: {str(e)}")
             raise
-        finally:
-            if lua_path:
-                self._cleanup_lua_script(lua_path)
 
-    def _create_lua_script(self, input_path: Path) -> Path:
+    @staticmethod
+    def _shift_heading_levels(ast: dict) -> dict:
         """
-        Create a temporary Lua script for pandoc filtering.
+        Promote every Header below level 1 in a pandoc JSON AST by one level.
 
-        The script adjusts heading levels to match the desired hierarchy.
+        The pandoc server cannot run Lua filters, so this applies the Lua
+        script's Header function to the parsed document instead.
 
         Args:
-            input_path: Path to input file (used to determine script location)
+            ast: Document parsed by pandoc into its JSON representation
 
         Returns:
-            Path to the created Lua script
+            The same AST, modified in place
         """
-        lua_script = """
-        function Header(el)
-            if el.level > 1 then
-                el.level = el.level - 1
-            end
-            return el
-        end
+        stack = [ast]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                if node.get('t') == 'Header' and node['c'][0] > 1:
+                    node['c'][0] -= 1
+                stack.extend(node.values())
+            elif isinstance(node, list):
+                stack.extend(node)
+        return ast
+
+    @staticmethod
+    def _build_reader_params(content: str) -> dict:
+        """
+        Build the pandoc server request parsing Markdown into the JSON AST.
+
+        Args:
+            content: Markdown content without image references
+
+        Returns:
+            JSON-serializable conversion parameters
+        """
+        return {
+            'text': content,
+            'from': 'markdown',
+            'to': 'json'
+        }
+
+    def _build_server_params(self, ast: dict, title: str) -> dict:
+        """
+        Build the pandoc server request matching _build_pandoc_command options.
+
+        Args:
+            ast: Document as a pandoc JSON AST with adjusted heading levels
+            title: Document title
+
+        Returns:
+            JSON-serializable conversion parameters
+        """
+        return {
+            'text': json.dumps(ast),
+            'from': 'json',
+            'to': 'docx',
+            'wrap': 'none',
+            'columns': 999,
+            # The server does not highlight code by default, unlike the CLI
+            'highlight-style': 'pygments',
+            # The server reads metadata as pandoc MetaValues, not plain strings
+            'metadata': {
+                key: {'t': 'MetaString', 'c': value}
+                for key, value in (('title', title),
+                                   ('author', self.config.author),
+                                   ('date', self.config.date))
+            },
+            'table-of-contents': self.config.generate_toc,
+            'number-sections': self.config.generate_toc
+        }
+
+    def _request_pandoc_server(self, endpoint: str, payload) -> list:
         """
-        lua_path = input_path.parent / "adjust_headers.lua"
+        POST conversion parameters to the pandoc server.
+
+        Args:
+            endpoint: Either '/' for one conversion or '/batch' for several
+            payload: Parameters dict, or a list of them for '/batch'
+
+        Returns:
+            List of converted documents as bytes, one per request. Binary
+            formats are decoded from base64, text formats encoded as UTF-8.
 
-        if lua_path.exists():
-            logger.warning(f"Lua script already exists at {lua_path}, overwriting")
+        Raises:
+            RuntimeError: If the server reports an error or returns an
+                unexpected response
+        """
+        conn = http.client.HTTPConnection(
+            '127.0.0.1', self._server_port, timeout=self.SERVER_REQUEST_TIMEOUT
+        )
+        try:
+            conn.request(
+                'POST', endpoint, body=json.dumps(payload),
+                headers={'Content-Type': 'application/json',
+                         'Accept': 'application/json'}
+            )
+            response = conn.getresponse()
+            body = response.read()
+        except (OSError, http.client.HTTPException) as e:
+            logger.error(f"Pandoc server request failed: {e}")
+            raise RuntimeError(f"Pandoc server request failed: {e}")
+        finally:
+            conn.close()
+
+        if response.status != 200:
+            message = body.decode('utf-8', errors='replace')
+            logger.error(f"Pandoc conversion failed: {message}")
+            raise RuntimeError(f"Pandoc conversion failed: {message}")
+
+        # With an Accept: application/json header, every result is an object
+        # holding either 'output', 'base64' and 'messages', or 'error'
+        results = json.loads(body)
+        if not isinstance(results, list):
+            results = [results]
+
+        outputs = []
+        for result in results:
+            if not isinstance(result, dict):
+                logger.error(f"Unexpected pandoc server response: {result!r}")
+                raise RuntimeError(f"Unexpected pandoc server response: {result!r}")
+            if 'error' in result:
+                logger.error(f"Pandoc conversion failed: {result['error']}")
+                raise RuntimeError(f"Pandoc conversion failed: {result['error']}")
+            if result.get('base64'):
+                outputs.append(base64.b64decode(result['output']))
+            else:
+                outputs.append(result['output'].encode('utf-8'))
+        return outputs
+
+    def _convert_with_server(self, jobs: List[Tuple[Path, Path]], work_dir: Path) -> None:
+        """
+        Convert a batch of documents through the pandoc server.
+
+        Documents are sent SERVER_BATCH_SIZE at a time, so each request stays
+        within SERVER_REQUEST_TIMEOUT and a failure only affects its chunk.
+        Each chunk is parsed to the JSON AST, has its heading levels adjusted,
+        and is then written to DOCX.
+
+        Args:
+            jobs: List of (input_path, output_path) pairs
+            work_dir: Working directory containing img folder
+        """
+        for start in range(0, len(jobs), self.SERVER_BATCH_SIZE):
+            prepared = []
+            for input_path, output_path in jobs[start:start + self.SERVER_BATCH_SIZE]:
+                content = self._read_markdown_content(input_path)
+                document_title, image_refs, temp_content = self._scan_markdown(content)
+                prepared.append((output_path, document_title, image_refs, temp_content))
+
+            asts = self._request_pandoc_server(
+                '/batch',
+                [self._build_reader_params(text) for _, _, _, text in prepared]
+            )
+            payload = [
+                self._build_server_params(self._shift_heading_levels(json.loads(ast)), title)
+                for (_, title, _, _), ast in zip(prepared, asts)
+            ]
+            outputs = self._request_pandoc_server('/batch', payload)
+            logger.info("Pandoc conversion completed successfully")
 
-        with open(lua_path, 'w', encoding='utf-8') as f:
-            f.write(lua_script)
+            for (output_path, document_title, image_refs, _), data in zip(prepared, outputs):
+                self._post_process_document(data, output_path, document_title,
+                                            image_refs, work_dir)
+                logger.info(f"Conversion successful! File saved: {output_path}")
+
+    @classmethod
+    def _ensure_lua_script(cls) -> Path:
+        """
+        Return the Lua script for pandoc filtering, writing it on first use.
+
+        The script adjusts heading levels to match the desired hierarchy. It is
+        written once per process to a private temporary file, reused by every
+        conversion, and removed when the interpreter exits.
+
+        Returns:
+            Path to the Lua script
+        """
+        lua_path = cls._lua_script_path
+        if lua_path is not None and lua_path.exists():
+            return lua_path
+
+        fd, name = tempfile.mkstemp(prefix='md2docx_adjust_headers_', suffix='.lua')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(cls.LUA_FILTER)
+
+        lua_path = Path(name)
+        atexit.register(cls._cleanup_lua_script, lua_path)
+        cls._lua_script_path = lua_path
         return lua_path
 
-    def _build_pandoc_command(self, input_path: Path, output_path: Path,
-                             title: str, lua_path: Path) -> List[str]:
+    def _build_pandoc_command(self, title: str, lua_path: Path) -> List[str]:
         """
         Build the pandoc command with all necessary options.
 
+        The Markdown is read from stdin and the DOCX is written to stdout.
+
         Args:
-            input_path: Input markdown file
-            output_path: Output docx file
             title: Document title
             lua_path: Path to Lua filter script
 
@@ -370,9 +843,9 @@ class MarkdownToDocxConverter:
             Command as list of strings
         """
         cmd = [
-            'pandoc',
-            str(input_path),
-            '-o', str(output_path),
+            _pandoc_path(),
+            '-',
+            '-o', '-',
             '-f', 'markdown',
             '-t', 'docx',
             '--wrap=none',
@@ -388,7 +861,8 @@ class MarkdownToDocxConverter:
 
         return cmd
 
-    def _cleanup_lua_script(self, lua_path: Path) -> None:
+    @staticmethod
+    def _cleanup_lua_script(lua_path: Path) -> None:
         """
         Remove temporary Lua script.
 
@@ -417,28 +891,132 @@ class MarkdownToDocxConverter:
             FileNotFoundError: If input file doesn't exist
             RuntimeError: If conversion fails
         """
-        work_dir, input_path, output_path = self._setup_paths(
-            input_file, output_file, working_dir
-        )
+        self.convert_many([(input_file, output_file)], working_dir)
+
+    def convert_many(self,
+                     inputs_outputs: List[Tuple[str, str]],
+                     working_dir: Optional[str] = None) -> None:
+        """
+        Convert several Markdown files to Word format in one batch.
+
+        All paths are validated before any conversion starts, and the image
+        directory is set up once for the whole batch. Pandoc
+        still runs once per document because the title block, table of
+        contents and section numbering it generates belong to a single file,
+        unless the converter was created with use_server=True, in which case the
+        whole batch is sent to the pandoc server in one request.
+
+        Args:
+            inputs_outputs: Sequence of (input_file, output_file) pairs
+            working_dir: Working directory (defaults to current directory)
+
+        Raises:
+            FileNotFoundError: If an input file doesn't exist
+            RuntimeError: If a conversion fails
+        """
+        jobs = []
+        for input_file, output_file in inputs_outputs:
+            work_dir, input_path, output_path = self._setup_paths(
+                input_file, output_file, working_dir
+            )
+
+            if not input_path.exists():
+                raise FileNotFoundError(f"Input file not found: {input_path}")
+
+            if input_path.suffix.lower() not in {'.md', '.markdown'}:
+                logger.warning(f"Input file {input_path} may not be a markdown file")
+
+            jobs.append((input_path, output_path))
+
+        if not jobs:
+            return
+
+        self._create_image_directory(work_dir)
+
+        if self._pandoc_proc is not None:
+            self._convert_with_server(jobs, work_dir)
+            return
+
+        lua_path = self._ensure_lua_script()
 
-        if not input_path.exists():
-            raise FileNotFoundError(f"Input file not found: {input_path}")
+        for input_path, output_path in jobs:
+            self._convert_single(input_path, output_path, work_dir, lua_path)
 
-        if input_path.suffix.lower() not in {'.md', '.markdown'}:
-            logger.warning(f"Input file {input_path} may not be a markdown file")
+    @classmethod
+    def convert_batch(cls,
+                      config: Optional[DocumentConfig],
+                      inputs_outputs: List[Tuple[str, str]],
+                      working_dir: Optional[str] = None,
+                      workers: Optional[int] = None,
+                      verbose: bool = True) -> None:
+        """
+        Convert several Markdown files in parallel worker processes.
+
+        Each document is converted independently by its own converter in a
+        process pool, since the python-docx post-processing is pure Python and
+        would not run concurrently in threads. A failed document does not stop
+        the rest of the batch.
+
+        Args:
+            config: Document configuration shared by all documents
+            inputs_outputs: Sequence of (input_file, output_file) pairs
+            working_dir: Working directory (defaults to current directory)
+            workers: Number of worker processes (defaults to the CPU count)
+            verbose: Enable verbose logging output in the workers. As with
+                the converter, logging must be configured to see it.
+
+        Raises:
+            RuntimeError: If one or more conversions fail
+        """
+        jobs = list(inputs_outputs)
+        if not jobs:
+            return
 
-        img_dir = self._create_image_directory(work_dir)
+        max_workers = min(workers or os.cpu_count() or 1, len(jobs))
+        failures = []
+
+        # Written here so the workers share this process's copy and its cleanup
+        lua_path = cls._ensure_lua_script()
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_convert_one, config, input_file, output_file,
+                                working_dir, verbose, lua_path): input_file
+                for input_file, output_file in jobs
+            }
+
+            for done, future in enumerate(as_completed(futures), start=1):
+                input_file = futures[future]
+                try:
+                    future.result()
+                    logger.info(f"[{done}/{len(jobs)}] Converted {input_file}")
+                except Exception as e:
+                    logger.error(f"[{done}/{len(jobs)}] Failed to convert {input_file}: {e}")
+                    failures.append(input_file)
+
+        if failures:
+            raise RuntimeError(
+                f"{len(failures)} of {len(jobs)} conversions failed: {', '.join(failures)}"
+            )
+
+    def _convert_single(self, input_path: Path, output_path: Path,
+                        work_dir: Path, lua_path: Path) -> None:
+        """
+        Convert one validated Markdown file using an existing Lua filter.
+
+        Args:
+            input_path: Path to input markdown file
+            output_path: Path to output docx file
+            work_dir: Working directory containing img folder
+            lua_path: Path to Lua filter script
+        """
         content = self._read_markdown_content(input_path)
-        document_title = self._extract_title_from_markdown(content)
-        image_refs = self._extract_image_references(content)
-        temp_md = self._create_temp_markdown(content, work_dir, input_path)
+        document_title, image_refs, temp_content = self._scan_markdown(content)
 
-        try:
-            self._run_pandoc_conversion(temp_md, output_path, document_title)
-            self._post_process_document(output_path, document_title, image_refs, work_dir)
-            logger.info(f"Conversion successful! File saved: {output_path}")
-        finally:
-            self._cleanup_temp_markdown(temp_md)
+        docx_data = self._run_pandoc_conversion(temp_content, document_title, lua_path)
+        self._post_process_document(docx_data, output_path, document_title,
+                                    image_refs, work_dir)
+        logger.info(f"Conversion successful! File saved: {output_path}")
 
     def _setup_paths(self, input_file: str, output_file: str,
                      working_dir: Optional[str]) -> Tuple[Path, Path, Path]:
@@ -448,7 +1026,7 @@ class MarkdownToDocxConverter:
         Args:
             input_file: Input filename or absolute path
             output_file: Output filename or absolute path
-            working_dir: Working directory (used for relative paths and temp files)
+            working_dir: Working directory (used for relative paths and the img folder)
 
         Returns:
             Tuple of (working_dir, input_path, output_path)
@@ -482,7 +1060,7 @@ class MarkdownToDocxConverter:
         """
         img_dir = work_dir / "img"
         if not img_dir.exists():
-            img_dir.mkdir(parents=True)
+            img_dir.mkdir(parents=True, exist_ok=True)
             logger.info(f"Created image directory: {img_dir}")
         return img_dir
 
@@ -505,59 +1083,32 @@ class MarkdownToDocxConverter:
         except IOError as e:
             raise IOError(f"Cannot read markdown file: {e}")
 
-    def _create_temp_markdown(self, content: str, work_dir: Path,
-                             input_path: Path) -> Path:
+    def _set_language_for_run(self, rPr) -> None:
         """
-        Create temporary markdown file without image references.
+        Set language for a run element.
 
         Args:
-            content: Original markdown content
-            work_dir: Working directory
-            input_path: Original input path
-
-        Returns:
-            Path to temporary file
+            rPr: Run properties element
         """
-        temp_content = self._remove_image_references(content)
-        temp_md = work_dir / f"temp_{input_path.name}"
-
-        try:
-            with open(temp_md, 'w', encoding='utf-8') as f:
-                f.write(temp_content)
-        except IOError as e:
-            raise IOError(f"Cannot create temporary markdown file: {e}")
+        existing_lang = rPr.find(_QN_LANG)
+        if existing_lang is not None:
+            rPr.remove(existing_lang)
 
-        return temp_md
+        rPr.append(copy.deepcopy(self._lang_element))
 
-    def _cleanup_temp_markdown(self, temp_md: Path) -> None:
+    def _set_language_for_runs(self, root) -> None:
         """
-        Remove temporary markdown file.
+        Set language for every run below an element in a single tree walk.
 
         Args:
-            temp_md: Path to temporary file
+            root: Element whose runs are updated (document body, footnotes)
         """
-        try:
-            if temp_md.exists():
-                temp_md.unlink()
-        except Exception as e:
-            logger.warning(f"Could not delete temporary markdown file: {e}")
-
-    def _set_language_for_run(self, rPr) -> None:
-        """
-        Set language for a run element.
-
-        Args:
-            rPr: Run properties element
-        """
-        lang_elements = rPr.findall(qn('w:lang'))
-        for lang in lang_elements:
-            rPr.remove(lang)
-
-        lang = OxmlElement('w:lang')
-        lang.set(qn('w:val'), self.config.language)
-        lang.set(qn('w:eastAsia'), self.config.language)
-        lang.set(qn('w:bidi'), self.config.language)
-        rPr.append(lang)
+        for r in root.iter(_QN_R):
+            rPr = r.find(_QN_RPR)
+            if rPr is None:
+                rPr = OxmlElement('w:rPr')
+                r.insert(0, rPr)
+            self._set_language_for_run(rPr)
 
     def _setup_footers(self, doc: Document) -> None:
         """
@@ -570,70 +1121,32 @@ class MarkdownToDocxConverter:
         Args:
             doc: Document object to modify
         """
+        # Odd/even headers and footers are a document-wide setting
+        doc.settings.odd_and_even_pages_header_footer = True
+
         for section in doc.sections:
-            # Configure section for different odd/even pages
-            sectPr = section._sectPr
-            if not sectPr.find(qn('w:titlePg')):
-                titlePg = OxmlElement('w:titlePg')
-                sectPr.append(titlePg)
-            if not sectPr.find(qn('w:evenAndOddHeaders')):
-                evenAndOddHeaders = OxmlElement('w:evenAndOddHeaders')
-                sectPr.append(evenAndOddHeaders)
-
-            # Configure headers/footers
+            # Configure section for a different first page
             section.different_first_page_header_footer = True
-            section.odd_and_even_pages_header_footer = True
-
-            # Configure odd page footer (right pages)
-            footer_odd = section.footer
-            p_odd = footer_odd.paragraphs[0] if footer_odd.paragraphs else footer_odd.add_paragraph()
-            p_odd.clear()
-            p_odd.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-            p_odd.paragraph_format.space_before = Pt(12)
-
-            # Add text and page number for odd pages
-            run_odd = p_odd.add_run(f"{self.config.footer_text['odd']} | ")
-            run_odd.font.name = self.config.font_name
-            run_odd.font.size = Pt(DocumentConfig.DEFAULT_FOOTER_FONT_SIZE)
-            self._add_page_number(p_odd)
-
-            # Configure even page footer (left pages)
-            footer_even = section.even_page_footer
-            p_even = footer_even.paragraphs[0] if footer_even.paragraphs else footer_even.add_paragraph()
-            p_even.clear()
-            p_even.alignment = WD_ALIGN_PARAGRAPH.LEFT
-            p_even.paragraph_format.space_before = Pt(12)
-
-            # Add page number and text for even pages
-            self._add_page_number(p_even)
-            run_even = p_even.add_run(f" | {self.config.footer_text['even']}")
-            run_even.font.name = self.config.font_name
-            run_even.font.size = Pt(DocumentConfig.DEFAULT_FOOTER_FONT_SIZE)
-
-    def _add_page_number(self, paragraph) -> None:
-        """
-        Add a dynamic page number field to a paragraph.
 
-        Args:
-            paragraph: Paragraph object to add page number to
-        """
-        run = paragraph.add_run()
-
-        # Begin field character
-        fldChar1 = OxmlElement('w:fldChar')
-        fldChar1.set(qn('w:fldCharType'), 'begin')
-        run._r.append(fldChar1)
+            # Odd (right) and even (left) page footers
+            self._replace_footer_paragraph(section.footer, self._footer_odd_xml)
+            self._replace_footer_paragraph(section.even_page_footer, self._footer_even_xml)
 
-        # Instruction text
-        instrText = OxmlElement('w:instrText')
-        instrText.set(qn('xml:space'), 'preserve')
-        instrText.text = "PAGE"
-        run._r.append(instrText)
+    def _replace_footer_paragraph(self, footer, footer_xml: str) -> None:
+        """
+        Replace the first paragraph of a footer with a prebuilt paragraph.
 
-        # End field character
-        fldChar2 = OxmlElement('w:fldChar')
-        fldChar2.set(qn('w:fldCharType'), 'end')
-        run._r.append(fldChar2)
+        Args:
+            footer: Footer to modify
+            footer_xml: Serialized footer paragraph
+        """
+        ftr = footer._element
+        paragraph = parse_xml(footer_xml)
+        existing = ftr.find(_QN_P)
+        if existing is not None:
+            ftr.replace(existing, paragraph)
+        else:
+            ftr.append(paragraph)
 
     def _process_footnotes(self, doc: Document) -> None:
         """
@@ -646,15 +1159,15 @@ class MarkdownToDocxConverter:
             # Configure footnote text style
             style = doc.styles['Footnote Text']
             style.font.name = self.config.font_name
-            style.font.size = Pt(DocumentConfig.DEFAULT_FOOTNOTE_FONT_SIZE)
-            style.paragraph_format.space_before = Pt(0)
-            style.paragraph_format.space_after = Pt(0)
+            style.font.size = self._pt_footnote
+            style.paragraph_format.space_before = _pt(0)
+            style.paragraph_format.space_after = _pt(0)
             style.paragraph_format.line_spacing = 1.0
 
             # Configure footnote reference style
             ref_style = doc.styles['Footnote Reference']
             ref_style.font.name = self.config.font_name
-            ref_style.font.size = Pt(DocumentConfig.DEFAULT_FOOTNOTE_FONT_SIZE)
+            ref_style.font.size = self._pt_footnote
             ref_style.font.superscript = True
 
             # Apply language to footnote style
@@ -662,55 +1175,59 @@ class MarkdownToDocxConverter:
             rPr = style_element.get_or_add_rPr()
             self._set_language_for_run(rPr)
 
-            # Process each footnote if they exist
+            # Process each footnote if they exist. The footnotes part only holds
+            # footnote elements, so walk its paragraphs and runs directly with
+            # lxml's iterators rather than through python-docx wrappers.
             if hasattr(doc, '_part') and hasattr(doc._part, '_footnotes_part') and doc._part._footnotes_part:
-                footnotes = doc._part._footnotes_part.element.xpath('//w:footnote')
-                for footnote in footnotes:
-                    for p in footnote.xpath('.//w:p'):
-                        pPr = p.get_or_add_pPr()
+                footnotes_root = doc._part._footnotes_part.element
+                for p in footnotes_root.iter(_QN_P):
+                    pPr = p.find(_QN_PPR)
+                    if pPr is None:
+                        pPr = OxmlElement('w:pPr')
+                        p.insert(0, pPr)
 
-                        spacing = parse_xml(f'<w:spacing {qn("w")}:before="0" {qn("w")}:after="0" {qn("w")}:line="240" {qn("w")}:lineRule="auto"/>')
-                        existing_spacing = pPr.find(qn('w:spacing'))
-                        if existing_spacing is not None:
-                            pPr.remove(existing_spacing)
-                        pPr.append(spacing)
+                    existing_spacing = pPr.find(_QN_SPACING)
+                    if existing_spacing is not None:
+                        pPr.remove(existing_spacing)
+                    pPr.append(copy.deepcopy(_FOOTNOTE_SPACING))
 
-                        for r in p.xpath('.//w:r'):
-                            rPr = r.get_or_add_rPr()
-                            self._set_language_for_run(rPr)
+                if self.config.per_run_language:
+                    self._set_language_for_runs(footnotes_root)
 
         except KeyError as e:
             logger.warning(f"Footnote style not found: {e}")
         except Exception as e:
             logger.warning(f"Warning while processing footnotes: {str(e)}")
 
-    def _post_process_document(self, doc_path: Path, document_title: str,
-                               image_refs: List[dict], work_dir: Path) -> None:
+    def _post_process_document(self, docx_data: bytes, output_path: Path,
+                               document_title: str, image_refs: Deque[dict],
+                               work_dir: Path) -> None:
         """
         Post-process the Word document with all formatting requirements.
 
         This method applies all styling, handles title formatting (including centering),
-        inserts images, and processes all document elements.
+        inserts images, and processes all document elements. The package produced
+        by pandoc is loaded from memory and written to disk only once, after
+        post-processing.
 
         Args:
-            doc_path: Path to the document file
+            docx_data: Raw bytes of the DOCX produced by pandoc
+            output_path: Path where the finished document is saved
             document_title: Main document title
-            image_refs: List of image references to insert
+            image_refs: Queue of image references to insert
             work_dir: Working directory containing img folder
         """
-        doc = Document(doc_path)
+        doc = Document(io.BytesIO(docx_data))
 
         # Apply basic styles
         self._apply_global_styles(doc)
 
-        # Find and style the title (first occurrence)
-        self._style_main_title(doc, document_title)
-
-        # Process all remaining paragraphs and insert images
-        self._process_paragraphs_and_images(doc, image_refs, work_dir)
+        # Style the title, format paragraphs, insert images and format tables
+        self._process_body(doc, document_title, image_refs, work_dir)
 
-        # Process tables
-        self._process_tables(doc)
+        # Write the language on every body run when not relying on the default
+        if self.config.per_run_language:
+            self._set_language_for_runs(doc.element.body)
 
         # Process footnotes
         self._process_footnotes(doc)
@@ -720,93 +1237,123 @@ class MarkdownToDocxConverter:
 
         # Save the changes
         try:
-            doc.save(doc_path)
+            doc.save(output_path)
         except Exception as e:
             raise IOError(f"Cannot save document: {e}")
 
-    def _style_main_title(self, doc: Document, document_title: str) -> None:
+    def _process_body(self, doc: Document, document_title: str,
+                      image_refs: Deque[dict], work_dir: Path) -> None:
+        """
+        Walk the document body once, dispatching each paragraph and table.
+
+        The first paragraph matching the title is styled as the main title and
+        the two paragraphs after it (author and date) are reformatted. Every
+        paragraph then gets image insertion or normal formatting, and every
+        table gets cell formatting and borders.
+
+        Args:
+            doc: Document object to modify
+            document_title: Main document title
+            image_refs: Queue of image references to insert
+            work_dir: Working directory containing img folder
+        """
+        img_dir = work_dir / "img"
+        title_found = False
+        title_info_remaining = 2
+
+        for block in doc.iter_inner_content():
+            if isinstance(block, Table):
+                self._process_table(block)
+                continue
+
+            # Restyling the title block keeps the text, so it is read only once
+            text = block.text
+
+            if not title_found:
+                if text == document_title:
+                    self._style_title_paragraph(doc, block, document_title)
+                    title_found = True
+            elif title_info_remaining:
+                # Style author and date paragraphs (next 2 paragraphs after title)
+                self._style_title_info_paragraph(block, text)
+                title_info_remaining -= 1
+
+            self._process_paragraph(block, text, image_refs, img_dir)
+
+    def _style_title_paragraph(self, doc: Document, para, document_title: str) -> None:
         """
         Style the main title and optionally center it.
-        Also styles the author and date paragraphs that follow.
 
         Args:
             doc: Document object
+            para: Paragraph containing the title
             document_title: Title to style
         """
-        title_found = False
-        title_index = -1
-        
-        for i, para in enumerate(doc.paragraphs):
-            if para.text == document_title and not title_found:
-                # Style as Title
-                para.style = doc.styles['Title']
-                para.clear()
-                run = para.add_run(document_title)
-                run.font.name = self.config.font_name
-                run.font.size = Pt(DocumentConfig.DEFAULT_TITLE_SIZE)
-                run.font.bold = True
-                
-                # Center the title if configured
-                if self.config.center_title:
-                    para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                
-                title_found = True
-                title_index = i
-                
-            # Style author and date paragraphs (next 2 paragraphs after title)
-            elif title_found and i in [title_index + 1, title_index + 2]:
-                # Keep existing text but reformat
-                text = para.text
-                para.clear()
-                run = para.add_run(text)
-                run.font.name = self.config.font_name
-                run.font.size = Pt(self.config.base_font_size)
-                run.font.bold = False
-                
-                # Center if title is centered
-                if self.config.center_title:
-                    para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                
-            elif title_found and i > title_index + 2:
-                # Stop after processing title, author, and date
-                break
+        para.style = doc.styles['Title']
+        para.clear()
+        run = para.add_run(document_title)
+        run.font.name = self.config.font_name
+        run.font.size = self._pt_title
+        run.font.bold = True
+
+        # Center the title if configured
+        if self.config.center_title:
+            para.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
-    def _process_paragraphs_and_images(self, doc: Document, image_refs: List[dict],
-                                      work_dir: Path) -> None:
+    def _style_title_info_paragraph(self, para, text: str) -> None:
         """
-        Process all paragraphs in the document and insert images.
+        Reformat an author or date paragraph following the title.
 
         Args:
-            doc: Document object to modify
-            image_refs: List of image references to insert
-            work_dir: Working directory containing img folder
+            para: Paragraph to reformat
+            text: Current text of the paragraph
         """
-        img_dir = work_dir / "img"
+        # Keep existing text but reformat
+        para.clear()
+        run = para.add_run(text)
+        run.font.name = self.config.font_name
+        run.font.size = self._pt_base
+        run.font.bold = False
 
-        for para in doc.paragraphs:
-            # Check for image placeholder
-            if '[IMAGE_PLACEHOLDER]' in para.text and image_refs:
-                self._insert_single_image(para, image_refs, img_dir)
-                continue
+        # Center if title is centered
+        if self.config.center_title:
+            para.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
-            # Skip paragraphs with specific styles
-            if para.style.name in ['Title', 'Heading 1', 'Heading 2', 'Heading 3']:
-                continue
+    def _process_paragraph(self, para, text: str, image_refs: Deque[dict],
+                           img_dir: Path) -> None:
+        """
+        Insert an image into a placeholder paragraph, or format a normal paragraph.
 
-            # Process paragraphs with 'Normal' style or no specific style
-            if not para.style or para.style.name == 'Normal':
-                self._format_normal_paragraph(para)
+        Args:
+            para: Paragraph to process
+            text: Text of the paragraph
+            image_refs: Queue of image references to insert
+            img_dir: Image directory path
+        """
+        # Check for image placeholder
+        if '[IMAGE_PLACEHOLDER]' in text and image_refs:
+            self._insert_single_image(para, image_refs, img_dir)
+            return
+
+        # Skip paragraphs with specific styles
+        style_name = para.style.name
+        if style_name in self.UNFORMATTED_PARAGRAPH_STYLES:
+            return
 
-    def _insert_single_image(self, para, image_refs: List[dict], img_dir: Path) -> None:
+        # Process paragraphs with 'Normal' style or no specific style
+        if not para.style or style_name == 'Normal':
+            self._format_normal_paragraph(para)
+
+    def _insert_single_image(self, para, image_refs: Deque[dict], img_dir: Path) -> None:
         """
         Insert a single image into a paragraph.
 
         Args:
             para: Paragraph to insert image into
-            image_refs: List of image references
+            image_refs: Queue of image references
             img_dir: Image directory path
         """
-        img_ref = image_refs.pop(0)
+        img_ref = image_refs.popleft()
         image_path = img_dir / img_ref['path']
 
         if image_path.suffix.lower() not in self.SUPPORTED_IMAGE_EXTENSIONS:
@@ -818,13 +1365,19 @@ class MarkdownToDocxConverter:
             para.clear()
             run = para.add_run()
             try:
-                picture = run.add_picture(str(image_path))
-
-                # Set image size with aspect ratio preservation
-                if picture.width > self.MAX_IMAGE_WIDTH:
-                    aspect_ratio = picture.height / picture.width
-                    picture.width = self.MAX_IMAGE_WIDTH
-                    picture.height = int(picture.width * aspect_ratio)
+                # Add the image part once and size the picture from its parsed
+                # header, capping the width with aspect ratio preservation
+                rId, image = run.part.get_or_add_image(str(image_path))
+                width = height = None
+                if image.width > self.MAX_IMAGE_WIDTH:
+                    aspect_ratio = image.height / image.width
+                    width = self.MAX_IMAGE_WIDTH
+                    height = int(width * aspect_ratio)
+
+                cx, cy = image.scaled_dimensions(width, height)
+                run._r.add_drawing(CT_Inline.new_pic_inline(
+                    run.part.next_id, rId, image.filename, cx, cy
+                ))
 
                 para.alignment = WD_ALIGN_PARAGRAPH.CENTER
                 logger.info(f"Added image: {img_ref['path']}")
@@ -843,18 +1396,20 @@ class MarkdownToDocxConverter:
         Args:
             para: Paragraph to format
         """
-        para.paragraph_format.space_before = Pt(DocumentConfig.DEFAULT_PARAGRAPH_SPACING)
-        para.paragraph_format.space_after = Pt(DocumentConfig.DEFAULT_PARAGRAPH_SPACING)
+        para.paragraph_format.space_before = self._pt_para_spacing
+        para.paragraph_format.space_after = self._pt_para_spacing
         para.paragraph_format.line_spacing = self.config.line_spacing
 
+        font_name = self.config.font_name
         for run in para.runs:
-            run.font.name = self.config.font_name
-            run.font.size = Pt(self.config.base_font_size)
+            rPr = run._element.get_or_add_rPr()
 
-            # Set language for this run
-            run_element = run._element
-            rPr = run_element.get_or_add_rPr()
-            self._set_language_for_run(rPr)
+            # Only touch the font when pandoc did not already set it
+            if rPr.rFonts_ascii != font_name or rPr.rFonts_hAnsi != font_name:
+                rPr.rFonts_ascii = font_name
+                rPr.rFonts_hAnsi = font_name
+            if rPr.sz_val != self._pt_base:
+                rPr.sz_val = self._pt_base
 
     def _apply_global_styles(self, doc: Document) -> None:
         """
@@ -875,63 +1430,81 @@ class MarkdownToDocxConverter:
         Args:
             doc: Document object to modify
         """
-        element = OxmlElement('w:lang')
-        element.set(qn('w:val'), self.config.language)
-        element.set(qn('w:eastAsia'), self.config.language)
-        element.set(qn('w:bidi'), self.config.language)
-
         styles_element = doc.styles.element
-        if styles_element.find(qn('w:docDefaults')) is None:
-            doc_defaults = OxmlElement('w:docDefaults')
-            styles_element.insert(0, doc_defaults)
-        else:
-            doc_defaults = styles_element.find(qn('w:docDefaults'))
+        default_rpr = _XPATH_DEFAULT_RPR(styles_element)
+        r_pr = default_rpr[0] if default_rpr else self._add_default_rpr(styles_element)
 
-        if doc_defaults.find(qn('w:rPrDefault')) is None:
-            r_pr_default = OxmlElement('w:rPrDefault')
-            doc_defaults.insert(0, r_pr_default)
-        else:
-            r_pr_default = doc_defaults.find(qn('w:rPrDefault'))
-
-        if r_pr_default.find(qn('w:rPr')) is None:
-            r_pr = OxmlElement('w:rPr')
-            r_pr_default.insert(0, r_pr)
-        else:
-            r_pr = r_pr_default.find(qn('w:rPr'))
-
-        existing_lang = r_pr.find(qn('w:lang'))
+        existing_lang = r_pr.find(_QN_LANG)
         if existing_lang is not None:
             r_pr.remove(existing_lang)
 
-        r_pr.append(element)
+        r_pr.append(copy.deepcopy(self._lang_element))
 
-    def _configure_standard_styles(self, doc: Document) -> None:
+    @staticmethod
+    def _add_default_rpr(styles_element):
         """
-        Configure standard document styles (Normal, Title).
+        Create the missing part of the docDefaults/rPrDefault/rPr chain.
 
         Args:
-            doc: Document object to modify
+            styles_element: Root element of the styles part
+
+        Returns:
+            The default run properties element
         """
-        styles_to_configure = {
+        # Without any defaults, insert the whole chain at once
+        if styles_element.find(_QN_DOC_DEFAULTS) is None:
+            doc_defaults = copy.deepcopy(_DOC_DEFAULTS)
+            styles_element.insert(0, doc_defaults)
+            return doc_defaults[0][0]
+
+        parent = styles_element
+        for tag in (_QN_DOC_DEFAULTS, _QN_RPR_DEFAULT, _QN_RPR):
+            child = parent.find(tag)
+            if child is None:
+                # Each element of the chain must be the first child of its parent
+                child = etree.SubElement(parent, tag)
+                parent.insert(0, child)
+            parent = child
+        return parent
+
+    def _build_style_configurations(self) -> Tuple[dict, dict]:
+        """
+        Fill the style templates with the values that depend on the configuration.
+
+        Returns:
+            Tuple of (standard styles, heading styles) keyed by style name
+        """
+        font_name = self.config.font_name
+
+        standard_styles = {
             'Normal': {
+                **self.STANDARD_STYLES['Normal'],
                 'font_size': self.config.base_font_size,
-                'font_name': self.config.font_name,
-                'bold': False,
-                'space_before': 0,
-                'space_after': 0,
+                'font_name': font_name,
                 'line_spacing': self.config.line_spacing
             },
-            'Title': {
-                'font_size': DocumentConfig.DEFAULT_TITLE_SIZE,
-                'font_name': self.config.font_name,
-                'bold': True,
-                'space_before': 12,
-                'space_after': 12,
-                'line_spacing': 1.0
+            'Title': {**self.STANDARD_STYLES['Title'], 'font_name': font_name}
+        }
+
+        heading_styles = {
+            f'Heading {level}': {
+                **template,
+                'font_name': font_name,
+                'color': RGBColor(*self.config.heading_colors.get(level, (0, 0, 0)))
             }
+            for level, template in self.HEADING_STYLES.items()
         }
 
-        self._apply_style_configurations(doc, styles_to_configure)
+        return standard_styles, heading_styles
+
+    def _configure_standard_styles(self, doc: Document) -> None:
+        """
+        Configure standard document styles (Normal, Title).
+
+        Args:
+            doc: Document object to modify
+        """
+        self._apply_style_configurations(doc, self._standard_styles)
 
     def _configure_heading_styles(self, doc: Document) -> None:
         """
@@ -940,40 +1513,7 @@ class MarkdownToDocxConverter:
         Args:
             doc: Document object to modify
         """
-        heading_styles = {
-            'Heading 1': {
-                'font_size': DocumentConfig.DEFAULT_HEADING_1_SIZE,
-                'font_name': self.config.font_name,
-                'bold': True,
-                'space_before': 18,
-                'space_after': 12,
-                'line_spacing': 1.0,
-                'color': self.config.heading_colors.get(1, (0, 0, 0)),
-                'italic': False
-            },
-            'Heading 2': {
-                'font_size': DocumentConfig.DEFAULT_HEADING_2_SIZE,
-                'font_name': self.config.font_name,
-                'bold': True,
-                'space_before': 16,
-                'space_after': 10,
-                'line_spacing': 1.0,
-                'color': self.config.heading_colors.get(2, (0, 0, 0)),
-                'italic': False
-            },
-            'Heading 3': {
-                'font_size': DocumentConfig.DEFAULT_HEADING_3_SIZE,
-                'font_name': self.config.font_name,
-                'bold': True,
-                'space_before': 14,
-                'space_after': 8,
-                'line_spacing': 1.0,
-                'color': self.config.heading_colors.get(3, (0, 0, 0)),
-                'italic': True
-            }
-        }
-
-        self._apply_style_configurations(doc, heading_styles, is_heading=True)
+        self._apply_style_configurations(doc, self._heading_styles, is_heading=True)
 
     def _apply_style_configurations(self, doc: Document, styles_config: dict,
                                    is_heading: bool = False) -> None:
@@ -985,41 +1525,47 @@ class MarkdownToDocxConverter:
             styles_config: Dictionary of style configurations
             is_heading: Whether these are heading styles
         """
+        styles = doc.styles
         for style_name, config in styles_config.items():
             try:
-                style = doc.styles[style_name]
-
-                # Font configuration
-                style.font.name = config['font_name']
-                style.font.size = Pt(config['font_size'])
-                style.font.bold = config['bold']
-                if config.get('italic'):
-                    style.font.italic = True
-
-                # Color (if specified)
-                if 'color' in config:
-                    style.font.color.rgb = RGBColor(*config['color'])
-
-                # Paragraph formatting
-                style.paragraph_format.space_before = Pt(config['space_before'])
-                style.paragraph_format.space_after = Pt(config['space_after'])
-                style.paragraph_format.line_spacing = config['line_spacing']
-
-                # For heading styles, ensure they're not linked to other styles
-                if is_heading:
-                    if hasattr(style, 'base_style'):
-                        style.base_style = None
-
-                    # Remove any existing numbering
-                    if hasattr(style._element, 'pPr'):
-                        pPr = style._element.pPr
-                        if pPr is not None:
-                            numPr = pPr.find(qn('w:numPr'))
-                            if numPr is not None:
-                                pPr.remove(numPr)
-
+                style = styles[style_name]
             except KeyError:
                 logger.warning(f"Style '{style_name}' not found")
+                continue
+
+            # Write the run and paragraph properties directly, keeping any other
+            # properties the style already defines
+            style_element = style._element
+            rPr = style_element.get_or_add_rPr()
+
+            # Font configuration
+            rPr.rFonts_ascii = config['font_name']
+            rPr.rFonts_hAnsi = config['font_name']
+            rPr.sz_val = _pt(config['font_size'])
+            rPr.get_or_add_b().val = config['bold']
+            if config.get('italic'):
+                rPr.get_or_add_i().val = True
+
+            # Color (if specified), replacing any theme color
+            if 'color' in config:
+                rPr._remove_color()
+                rPr.get_or_add_color().val = config['color']
+
+            # Paragraph formatting
+            pPr = style_element.get_or_add_pPr()
+            pPr.spacing_before = _pt(config['space_before'])
+            pPr.spacing_after = _pt(config['space_after'])
+            pPr.spacing_line = Emu(config['line_spacing'] * self.SINGLE_LINE_SPACING)
+            pPr.spacing_lineRule = WD_LINE_SPACING.MULTIPLE
+
+            # For heading styles, ensure they're not linked to other styles
+            if is_heading:
+                if hasattr(style, 'base_style'):
+                    style.base_style = None
+
+                # Remove any existing numbering
+                for numPr in _XPATH_STYLE_NUMPR(style._element):
+                    numPr.getparent().remove(numPr)
 
     def _configure_section_properties(self, doc: Document) -> None:
         """
@@ -1028,103 +1574,100 @@ class MarkdownToDocxConverter:
         Args:
             doc: Document object to modify
         """
+        page_width, page_height = self._page_dimensions
+        top, right, bottom, left = self._margins
+
         for section in doc.sections:
             # Set page size
-            if self.config.paper_size == PaperSize.LETTER:
-                section.page_width = Inches(8.5)
-                section.page_height = Inches(11)
-            elif self.config.paper_size == PaperSize.LEGAL:
-                section.page_width = Inches(8.5)
-                section.page_height = Inches(14)
-            else:  # A4
-                section.page_width = Inches(8.27)
-                section.page_height = Inches(11.69)
+            section.page_width = page_width
+            section.page_height = page_height
 
             # Set margins
-            section.top_margin = Cm(self.config.margins[0])
-            section.right_margin = Cm(self.config.margins[1])
-            section.bottom_margin = Cm(self.config.margins[2])
-            section.left_margin = Cm(self.config.margins[3])
+            section.top_margin = top
+            section.right_margin = right
+            section.bottom_margin = bottom
+            section.left_margin = left
 
-    def _process_tables(self, doc: Document) -> None:
+    def _process_table(self, table: Table) -> None:
         """
-        Process all tables in the document with formatting and borders.
+        Format a table's cells and add borders.
+
+        The row and cell elements are walked directly rather than through
+        python-docx's row and cell wrappers, which build a cell for every grid
+        position a merged cell spans. Each cell is therefore processed exactly
+        once.
 
         Args:
-            doc: Document object to modify
+            table: Table to modify
         """
-        for table in doc.tables:
-            # Process header row (first row)
-            if table.rows:
-                for cell in table.rows[0].cells:
-                    self._format_table_cell(cell, is_header=True)
+        # The first row is the header row
+        for i, tr in enumerate(table._tbl.tr_lst):
+            is_header = i == 0
+            for tc in tr.tc_lst:
+                # Continuation of a vertical merge, processed with the cell above
+                if tc.vMerge == 'continue':
+                    continue
 
-            # Process all rows
-            for row in table.rows:
-                for cell in row.cells:
-                    self._format_table_cell(cell, is_header=False)
-                    self._set_cell_borders(cell)
+                self._format_table_cell(tc, is_header=is_header)
+                self._set_cell_borders(tc)
 
-    def _format_table_cell(self, cell: _Cell, is_header: bool = False) -> None:
+    def _format_table_cell(self, tc: CT_Tc, is_header: bool = False) -> None:
         """
         Format a table cell with appropriate styling.
 
         Args:
-            cell: Cell to format
+            tc: Cell element to format
             is_header: Whether this is a header cell
         """
-        for para in cell.paragraphs:
-            for run in para.runs:
-                run.font.name = self.config.font_name
-                run.font.size = Pt(DocumentConfig.DEFAULT_TABLE_FONT_SIZE)
-                if is_header:
-                    run.font.bold = True
+        font_name = self.config.font_name
+        pt_size = self._pt_table_font
+        pt_space = self._pt_table_spacing
 
-                # Set language for this run
-                run_element = run._element
-                rPr = run_element.get_or_add_rPr()
-                self._set_language_for_run(rPr)
+        for p in tc.p_lst:
+            r_lst = p.r_lst
 
             # Ensure paragraph has at least one run
-            if not para.runs:
-                run = para.add_run()
-                run.font.name = self.config.font_name
-                run.font.size = Pt(DocumentConfig.DEFAULT_TABLE_FONT_SIZE)
+            if not r_lst:
+                r_lst = [p.add_r()]
+
+            for r in r_lst:
+                rPr = r.get_or_add_rPr()
+                rPr.rFonts_ascii = font_name
+                rPr.rFonts_hAnsi = font_name
+                rPr.sz_val = pt_size
                 if is_header:
-                    run.font.bold = True
+                    rPr.get_or_add_b().val = True
 
-            # Set paragraph properties
-            para.paragraph_format.space_before = Pt(DocumentConfig.DEFAULT_TABLE_CELL_SPACING)
-            para.paragraph_format.space_after = Pt(DocumentConfig.DEFAULT_TABLE_CELL_SPACING)
-            para.paragraph_format.line_spacing = 1.0
+            # Set paragraph properties (single line spacing)
+            pPr = p.get_or_add_pPr()
+            pPr.spacing_before = pt_space
+            pPr.spacing_after = pt_space
+            pPr.spacing_line = self.SINGLE_LINE_SPACING
+            pPr.spacing_lineRule = WD_LINE_SPACING.MULTIPLE
 
-    def _set_cell_borders(self, cell: _Cell) -> None:
+    def _set_cell_borders(self, tc: CT_Tc) -> None:
         """
         Add borders to a table cell if not already present.
 
         Args:
-            cell: Cell object to add borders to
+            tc: Cell element to add borders to
         """
-        tc = cell._tc
         tcPr = tc.get_or_add_tcPr()
 
         # Check if borders already exist
-        existing_borders = tcPr.find(qn('w:tcBorders'))
+        existing_borders = tcPr.find(_QN_TCBORDERS)
         if existing_borders is not None:
             return  # Borders already set
 
-        # Create borders element
-        tcBorders = OxmlElement('w:tcBorders')
-        tcPr.append(tcBorders)
+        # Add a single border on each edge
+        tcPr.append(copy.deepcopy(_TC_BORDERS))
 
-        # Add each border
-        for border in ['top', 'left', 'bottom', 'right']:
-            edge = OxmlElement(f'w:{border}')
-            edge.set(qn('w:val'), 'single')
-            edge.set(qn('w:sz'), '4')
-            edge.set(qn('w:space'), '0')
-            edge.set(qn('w:color'), 'auto')
-            tcBorders.append(edge)
+
+def _convert_one(config: Optional[DocumentConfig], input_file: str, output_file: str,
+                 working_dir: Optional[str], verbose: bool, lua_path: Path) -> None:
+    """Convert a single document; module-level so worker processes can unpickle it."""
+    MarkdownToDocxConverter._lua_script_path = lua_path
+    MarkdownToDocxConverter(config, verbose=verbose).convert(input_file, output_file, working_dir)
 
 
 def main():
@@ -1164,4 +1707,8 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(levelname)s: %(message)s'
+    )
     main()
\ No newline at end of file